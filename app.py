@@ -1,15 +1,49 @@
+import gzip
+import heapq
+import json
 import os
-from flask import Flask, render_template, request, jsonify
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO, StringIO
+
+import pandas as pd
+from cachetools import TTLCache
+from flask import Flask, render_template, request, jsonify, Response, make_response
+from flask.json.provider import DefaultJSONProvider
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from config import Config
 from junkyard_prices import JunkyardPrices
 from ebay_api import EbayAPI
 from parts_analyzer import PartsAnalyzer
 from saved_parts import SavedPartsList
 from ebay_link_parser import EbayLinkParser
+from roi import rate_roi
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson - jsonify() serializes in C instead of stdlib json"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 app.config.from_object(Config)
 
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
 # Initialize components
 junkyard_prices = JunkyardPrices(Config.JUNKYARD_PRICES_CSV)
 ebay_api = EbayAPI()
@@ -17,6 +51,59 @@ analyzer = PartsAnalyzer(ebay_api, junkyard_prices)
 saved_list = SavedPartsList(Config.SAVED_PARTS_DB)
 link_parser = EbayLinkParser()
 
+# Junkyard prices are loaded once from CSV and never change at runtime,
+# so the /junkyard_parts payload can be serialized once at startup
+_JUNKYARD_JSON = json.dumps({
+    'success': True,
+    'parts': [
+        {'name': name, 'price': price}
+        for name, price in sorted(junkyard_prices.prices.items())
+        if price
+    ]
+}).encode()
+
+# Repeat /analyze requests for the same vehicle within 15 minutes return the
+# cached JSON bytes instead of re-running the whole eBay scan
+_analyze_cache = TTLCache(maxsize=512, ttl=900)
+_analyze_cache_lock = threading.Lock()
+
+# add_from_link jobs run on this pool; completed entries are dropped when the
+# client collects the result from /job/<job_id>, and jobs the browser never
+# comes back for expire after 10 minutes instead of leaking
+_link_pool = ThreadPoolExecutor(max_workers=8)
+_link_jobs = TTLCache(maxsize=256, ttl=600)
+_link_jobs_lock = threading.Lock()
+
+# Shared Excel styles - built once instead of per cell on every export
+_HEADER_FILL = PatternFill(start_color="667eea", end_color="667eea", fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+_HEADER_ALIGN = Alignment(horizontal='center', vertical='center')
+_CENTER_ALIGN = Alignment(horizontal='center')
+_LINK_FONT = Font(color="0563C1", underline="single")
+_YOUTUBE_FONT = Font(color="FF0000", underline="single", bold=True)
+_HIGH_FILL = PatternFill(start_color="28a745", end_color="28a745", fill_type="solid")
+_HIGH_FONT = Font(color="FFFFFF", bold=True)
+_MED_FILL = PatternFill(start_color="ffc107", end_color="ffc107", fill_type="solid")
+_MED_FONT = Font(bold=True)
+_LOW_FILL = PatternFill(start_color="dc3545", end_color="dc3545", fill_type="solid")
+_LOW_FONT = Font(color="FFFFFF", bold=True)
+
+def _maybe_gzip(response):
+    """Gzip a response body when the client accepts it
+
+    The HTML export in particular is highly repetitive markup and shrinks
+    ~15x. Not used for xlsx, which is already a ZIP.
+    """
+    response.headers['Vary'] = 'Accept-Encoding'
+    if 'gzip' not in request.headers.get('Accept-Encoding', '').lower():
+        return response
+
+    body = gzip.compress(response.get_data(), 6)
+    response.set_data(body)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Content-Length'] = str(len(body))
+    return response
+
 @app.route('/')
 def index():
     """Home page"""
@@ -35,16 +122,34 @@ def analyze():
         vehicle_type = data.get('vehicle_type', 'car')
         filter_type = data.get('filter_type', 'high_priority')  # high_priority, light, or all
 
+        # Serve repeat requests from the cache (stored pre-serialized)
+        cache_key = (year, make, model, vehicle_type, filter_type)
+        with _analyze_cache_lock:
+            cached = _analyze_cache.get(cache_key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+
         # Analyze vehicle
         results = analyzer.analyze_vehicle(year, make, model, vehicle_type, filter_type)
 
-        # Get top 5 parts
-        top_parts = analyzer.get_top_parts(results, 5)
+        # One pass over results: count High ratings and track the top-5 ROI
+        # with a bounded heap (negated index as tiebreak keeps order stable)
+        high_roi_count = 0
+        top_heap = []
+        for i, r in enumerate(results):
+            if r['roi_rating'] == 'High':
+                high_roi_count += 1
+            entry = (r['roi'], -i)
+            if len(top_heap) < 5:
+                heapq.heappush(top_heap, entry)
+            else:
+                heapq.heappushpop(top_heap, entry)
+        top_parts = [results[-neg_i] for _, neg_i in sorted(top_heap, reverse=True)]
 
         # Generate summary
         summary = {
             'total_parts': len(results),
-            'high_roi_count': len([r for r in results if r['roi_rating'] == 'High']),
+            'high_roi_count': high_roi_count,
             'top_5_parts': [
                 {'name': p['part_name'], 'roi': p['roi']}
                 for p in top_parts
@@ -52,14 +157,18 @@ def analyze():
             'vehicle_info': f"{year} {make} {model} {trim}".strip()
         }
 
-        return jsonify({
+        response = jsonify({
             'success': True,
             'results': results,
             'summary': summary
         })
+
+        with _analyze_cache_lock:
+            _analyze_cache[cache_key] = response.get_data()
+
+        return response
     except Exception as e:
         print(f"ERROR in /analyze: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({
             'success': False,
@@ -95,9 +204,49 @@ def manual_add():
 
 @app.route('/add_from_link', methods=['POST'])
 def add_from_link():
-    """Add a part from eBay listing link"""
+    """Queue adding a part from an eBay listing link
+
+    The link parse is a full HTTP fetch of the listing page, so it runs on a
+    background pool; the client polls /job/<job_id> for the outcome.
+    """
+    data = request.json
+    job_id = uuid.uuid4().hex
+    future = _link_pool.submit(_do_add_from_link, data)
+    with _link_jobs_lock:
+        _link_jobs[job_id] = future
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id
+    })
+
+@app.route('/job/<job_id>')
+def job_status(job_id):
+    """Poll a queued add-from-link job"""
+    with _link_jobs_lock:
+        future = _link_jobs.get(job_id)
+
+    if future is None:
+        return jsonify({
+            'success': False,
+            'error': 'Unknown job id'
+        }), 404
+
+    if not future.done():
+        return jsonify({
+            'success': True,
+            'state': 'pending'
+        })
+
+    with _link_jobs_lock:
+        _link_jobs.pop(job_id, None)
+
+    payload, status = future.result()
+    return jsonify(dict(payload, state='done')), status
+
+def _do_add_from_link(data):
+    """Add a part from an eBay listing link (runs on the link pool)"""
     try:
-        data = request.json
         ebay_url = data.get('ebay_url')
         custom_part_name = data.get('custom_part_name', '').strip()
         vehicle_type = data.get('vehicle_type', 'car')  # car or truck
@@ -109,10 +258,10 @@ def add_from_link():
         parsed_data = link_parser.parse_link(ebay_url)
 
         if not parsed_data['success']:
-            return jsonify({
+            return {
                 'success': False,
                 'error': parsed_data.get('error', 'Failed to parse eBay link')
-            }), 400
+            }, 400
 
         # Determine part name: custom > junkyard part > auto-extracted from eBay
         if custom_part_name:
@@ -142,16 +291,13 @@ def add_from_link():
             # Try to find junkyard price
             matched_price = junkyard_prices.get_price(part_name)
 
-            # If not found, try to match keywords
+            # If not found, try to match keywords against the cached uppercase index
             if matched_price is None:
-                all_parts = junkyard_prices.get_all_parts()
-                part_name_upper = part_name.upper()
-                for junk_part in all_parts:
-                    if part_name_upper in junk_part.upper() or junk_part.upper() in part_name_upper:
-                        matched_price = junkyard_prices.get_price(junk_part)
-                        if matched_price:
-                            junkyard_part_names = [junk_part]
-                            break
+                matched_name = junkyard_prices.match_part(part_name)
+                if matched_name:
+                    matched_price = junkyard_prices.get_price_upper(matched_name)
+                    if matched_price:
+                        junkyard_part_names = [matched_name]
 
             if matched_price:
                 junkyard_price = matched_price
@@ -163,12 +309,7 @@ def add_from_link():
             roi = ebay_price / junkyard_price
 
         # Determine ROI rating
-        if roi < 2:
-            roi_rating = "Low"
-        elif roi < 5:
-            roi_rating = "Medium"
-        else:
-            roi_rating = "High"
+        roi_rating = rate_roi(roi)
 
         # Create part data
         part_data = {
@@ -191,38 +332,23 @@ def add_from_link():
         # Add to saved list
         saved_list.add_part(part_data)
 
-        return jsonify({
+        return {
             'success': True,
             'part': part_data
-        })
+        }, 200
 
     except Exception as e:
         print(f"ERROR in /add_from_link: {str(e)}")
-        import traceback
         traceback.print_exc()
-        return jsonify({
+        return {
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500
 
 @app.route('/junkyard_parts')
 def get_junkyard_parts():
-    """Get all junkyard parts with prices"""
-    all_parts = junkyard_prices.get_all_parts()
-    parts_with_prices = []
-
-    for part in all_parts:
-        price = junkyard_prices.get_price(part)
-        if price:
-            parts_with_prices.append({
-                'name': part,
-                'price': price
-            })
-
-    return jsonify({
-        'success': True,
-        'parts': parts_with_prices
-    })
+    """Get all junkyard parts with prices (serialized once at startup)"""
+    return Response(_JUNKYARD_JSON, mimetype='application/json')
 
 @app.route('/saved_list')
 def get_saved_list():
@@ -234,26 +360,27 @@ def get_saved_list():
         'parts': parts
     })
 
-@app.route('/remove_part/<int:index>', methods=['DELETE'])
-def remove_part(index):
+@app.route('/remove_part/<part_id>', methods=['DELETE'])
+def remove_part(part_id):
     """Remove a part from saved list"""
-    success = saved_list.remove_part(index)
+    success = saved_list.remove_part(part_id)
 
     return jsonify({
         'success': success
     })
 
-@app.route('/update_part/<int:index>', methods=['PUT'])
-def update_part(index):
+@app.route('/update_part/<part_id>', methods=['PUT'])
+def update_part(part_id):
     """Update a saved part's notes and YouTube link"""
     try:
         data = request.json
         youtube_link = data.get('youtube_link', '')
         notes = data.get('notes', '')
 
-        if 0 <= index < len(saved_list.parts):
-            saved_list.parts[index]['youtube_link'] = youtube_link
-            saved_list.parts[index]['notes'] = notes
+        part = saved_list.get(part_id)
+        if part is not None:
+            part['youtube_link'] = youtube_link
+            part['notes'] = notes
             saved_list.save()
 
             return jsonify({
@@ -263,7 +390,7 @@ def update_part(index):
         else:
             return jsonify({
                 'success': False,
-                'error': 'Invalid part index'
+                'error': 'Unknown part id'
             }), 400
 
     except Exception as e:
@@ -276,8 +403,7 @@ def update_part(index):
 def clear_all():
     """Clear all saved parts"""
     try:
-        saved_list.parts = []
-        saved_list.save()
+        saved_list.clear_all()
         return jsonify({
             'success': True,
             'message': 'All parts cleared!'
@@ -291,115 +417,104 @@ def clear_all():
 @app.route('/export_excel')
 def export_excel():
     """Export saved parts to Excel with clickable links"""
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
-    from io import BytesIO
-    from flask import make_response
-
-    # Create workbook with two sheets
-    wb = Workbook()
-
-    # Separate cars and trucks
-    cars = [p for p in saved_list.parts if p.get('vehicle_type') == 'car']
-    trucks = [p for p in saved_list.parts if p.get('vehicle_type') != 'car']
-
-    def create_sheet(ws, parts, title):
-        ws.title = title
-
-        # Header style
-        header_fill = PatternFill(start_color="667eea", end_color="667eea", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-
-        # Headers
+    # Write-only workbook streams rows into the ZIP as they are appended
+    # instead of holding a styled Cell object per value in memory
+    wb = Workbook(write_only=True)
+
+    # Partitions are maintained incrementally by SavedPartsList
+    cars = saved_list.cars
+    trucks = saved_list.trucks
+
+    # Column widths (must be set before rows are appended in write-only mode)
+    column_widths = {
+        'A': 25,  # Part Name
+        'B': 40,  # eBay Listing
+        'C': 12,  # Junkyard $
+        'D': 12,  # eBay $
+        'E': 10,  # ROI
+        'F': 12,  # Rating
+        'G': 15,  # YouTube
+        'H': 35,  # Notes
+        'I': 18   # Added
+    }
+
+    def create_sheet(parts, title):
+        ws = wb.create_sheet(title)
+
+        for col, width in column_widths.items():
+            ws.column_dimensions[col].width = width
+
+        # Header row
         headers = ['Part Name', 'eBay Listing', 'Junkyard $', 'eBay $', 'ROI', 'Rating', 'YouTube', 'Notes', 'Added']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _HEADER_ALIGN
+            header_row.append(cell)
+        ws.append(header_row)
 
         # Data rows
-        for row_idx, part in enumerate(parts, 2):
+        for part in parts:
             ebay_price = part.get('ebay_price', part.get('ebay_sold_price', part.get('median_sold_price', 0)))
             roi_rating = part.get('roi_rating', 'N/A')
 
             # Part name
-            ws.cell(row=row_idx, column=1, value=part.get('part_name', ''))
+            name_cell = WriteOnlyCell(ws, value=part.get('part_name', ''))
 
             # eBay listing (clickable link)
             ebay_url = part.get('ebay_url', '')
-            ebay_title = part.get('ebay_title', 'View Listing')[:50]
+            listing_cell = WriteOnlyCell(ws, value=part.get('ebay_title', 'View Listing')[:50])
             if ebay_url:
-                cell = ws.cell(row=row_idx, column=2, value=ebay_title)
-                cell.hyperlink = ebay_url
-                cell.font = Font(color="0563C1", underline="single")
-            else:
-                ws.cell(row=row_idx, column=2, value=ebay_title)
-
-            # Junkyard price
-            ws.cell(row=row_idx, column=3, value=f"${part.get('junkyard_price', 0):.2f}")
-
-            # eBay price
-            ws.cell(row=row_idx, column=4, value=f"${ebay_price:.2f}")
+                listing_cell.hyperlink = ebay_url
+                listing_cell.font = _LINK_FONT
 
-            # ROI
-            ws.cell(row=row_idx, column=5, value=f"{part.get('roi', 0):.2f}x")
+            # Prices and ROI
+            junkyard_cell = WriteOnlyCell(ws, value=f"${part.get('junkyard_price', 0):.2f}")
+            ebay_cell = WriteOnlyCell(ws, value=f"${ebay_price:.2f}")
+            roi_cell = WriteOnlyCell(ws, value=f"{part.get('roi', 0):.2f}x")
 
             # ROI Rating with color
-            rating_cell = ws.cell(row=row_idx, column=6, value=roi_rating)
+            rating_cell = WriteOnlyCell(ws, value=roi_rating)
             if roi_rating == 'High':
-                rating_cell.fill = PatternFill(start_color="28a745", end_color="28a745", fill_type="solid")
-                rating_cell.font = Font(color="FFFFFF", bold=True)
+                rating_cell.fill = _HIGH_FILL
+                rating_cell.font = _HIGH_FONT
             elif roi_rating == 'Medium':
-                rating_cell.fill = PatternFill(start_color="ffc107", end_color="ffc107", fill_type="solid")
-                rating_cell.font = Font(bold=True)
+                rating_cell.fill = _MED_FILL
+                rating_cell.font = _MED_FONT
             else:
-                rating_cell.fill = PatternFill(start_color="dc3545", end_color="dc3545", fill_type="solid")
-                rating_cell.font = Font(color="FFFFFF", bold=True)
-            rating_cell.alignment = Alignment(horizontal='center')
+                rating_cell.fill = _LOW_FILL
+                rating_cell.font = _LOW_FONT
+            rating_cell.alignment = _CENTER_ALIGN
 
             # YouTube link (clickable)
             youtube_url = part.get('youtube_link', '').strip()
             if youtube_url:
-                cell = ws.cell(row=row_idx, column=7, value="Watch Video")
-                cell.hyperlink = youtube_url
-                cell.font = Font(color="FF0000", underline="single", bold=True)
+                youtube_cell = WriteOnlyCell(ws, value="Watch Video")
+                youtube_cell.hyperlink = youtube_url
+                youtube_cell.font = _YOUTUBE_FONT
             else:
-                ws.cell(row=row_idx, column=7, value="-")
+                youtube_cell = WriteOnlyCell(ws, value="-")
 
-            # Notes
-            ws.cell(row=row_idx, column=8, value=part.get('notes', '-'))
+            # Notes and date added
+            notes_cell = WriteOnlyCell(ws, value=part.get('notes', '-'))
+            added_cell = WriteOnlyCell(ws, value=part.get('saved_at', ''))
 
-            # Date added
-            ws.cell(row=row_idx, column=9, value=part.get('saved_at', ''))
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25  # Part Name
-        ws.column_dimensions['B'].width = 40  # eBay Listing
-        ws.column_dimensions['C'].width = 12  # Junkyard $
-        ws.column_dimensions['D'].width = 12  # eBay $
-        ws.column_dimensions['E'].width = 10  # ROI
-        ws.column_dimensions['F'].width = 12  # Rating
-        ws.column_dimensions['G'].width = 15  # YouTube
-        ws.column_dimensions['H'].width = 35  # Notes
-        ws.column_dimensions['I'].width = 18  # Added
+            ws.append([name_cell, listing_cell, junkyard_cell, ebay_cell, roi_cell,
+                       rating_cell, youtube_cell, notes_cell, added_cell])
 
     # Create Cars sheet
     if cars:
-        ws_cars = wb.active
-        create_sheet(ws_cars, cars, "Cars")
+        create_sheet(cars, "Cars")
 
     # Create Trucks sheet
     if trucks:
-        if not cars:
-            ws_trucks = wb.active
-        else:
-            ws_trucks = wb.create_sheet("Trucks & SUVs")
-        create_sheet(ws_trucks, trucks, "Trucks & SUVs")
+        create_sheet(trucks, "Trucks & SUVs")
 
-    # Remove default sheet if we created custom ones
-    if 'Sheet' in wb.sheetnames and len(wb.sheetnames) > 1:
-        wb.remove(wb['Sheet'])
+    # Write-only workbooks start with no sheets - keep the file valid when empty
+    if not cars and not trucks:
+        create_sheet([], "Cars")
 
     # Save to BytesIO
     output = BytesIO()
@@ -414,263 +529,87 @@ def export_excel():
 @app.route('/export_csv')
 def export_csv():
     """Export saved parts to CSV"""
-    import csv
-    from io import StringIO
-    from flask import make_response
+    # Exported column -> (header label, default for missing values)
+    csv_columns = {
+        'part_name': ('Part Name', ''),
+        'ebay_title': ('eBay Title', ''),
+        'ebay_url': ('eBay URL', ''),
+        'best_listing_image': ('eBay Image', ''),  # eBay image URL
+        'ebay_price': ('eBay Price', 0),
+        'junkyard_parts': ('Junkyard Parts', ''),
+        'junkyard_price': ('Junkyard Price', 0),
+        'roi': ('ROI', 0),
+        'roi_rating': ('ROI Rating', ''),
+        'vehicle_type': ('Vehicle Type', ''),
+        'year': ('Year', ''),
+        'make': ('Make', ''),
+        'model': ('Model', ''),
+        'youtube_link': ('YouTube Tutorial', ''),
+        'notes': ('Notes', ''),
+        'saved_at': ('Date Added', '')
+    }
+
+    # Materialize the parts once and do the per-row work as column operations
+    df = pd.DataFrame(saved_list.parts)
+
+    # Make sure every exported column exists even if no saved part carries
+    # it - seeded as NaN so the price coalesce below still sees the
+    # fallback fields; defaults are applied in the trailing fillna
+    for field in csv_columns:
+        if field not in df.columns:
+            df[field] = float('nan')
+
+    # Coalesce the three possible eBay price fields in one vectorized pass
+    for fallback in ('ebay_sold_price', 'median_sold_price'):
+        if fallback in df.columns:
+            df['ebay_price'] = df['ebay_price'].fillna(df[fallback])
+
+    df['junkyard_parts'] = df['junkyard_parts'].map(
+        lambda parts: ', '.join(parts) if isinstance(parts, list) else ''
+    )
+
+    df = df.fillna({field: default for field, (_, default) in csv_columns.items()})
 
     output = StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow(['Part Name', 'eBay Title', 'eBay URL', 'eBay Image', 'eBay Price', 'Junkyard Parts', 'Junkyard Price', 'ROI', 'ROI Rating', 'Vehicle Type', 'Year', 'Make', 'Model', 'YouTube Tutorial', 'Notes', 'Date Added'])
-
-    # Write parts
-    for part in saved_list.parts:
-        writer.writerow([
-            part.get('part_name', ''),
-            part.get('ebay_title', ''),
-            part.get('ebay_url', ''),
-            part.get('best_listing_image', ''),  # eBay image URL
-            part.get('ebay_price', part.get('ebay_sold_price', part.get('median_sold_price', 0))),
-            ', '.join(part.get('junkyard_parts', [])) if part.get('junkyard_parts') else '',
-            part.get('junkyard_price', 0),
-            part.get('roi', 0),
-            part.get('roi_rating', ''),
-            part.get('vehicle_type', ''),
-            part.get('year', ''),
-            part.get('make', ''),
-            part.get('model', ''),
-            part.get('youtube_link', ''),
-            part.get('notes', ''),
-            part.get('saved_at', '')
-        ])
+    df.to_csv(
+        output,
+        columns=list(csv_columns),
+        header=[header for header, _ in csv_columns.values()],
+        index=False
+    )
 
     response = make_response(output.getvalue())
     response.headers['Content-Disposition'] = 'attachment; filename=parts_list.csv'
     response.headers['Content-Type'] = 'text/csv'
-    return response
+    return _maybe_gzip(response)
 
 @app.route('/download_html')
 def download_html():
     """Download saved parts as HTML file"""
-    from flask import make_response
-    from datetime import datetime
-
     # Get the HTML content
     html_content = generate_parts_html()
 
     response = make_response(html_content)
     response.headers['Content-Disposition'] = 'attachment; filename=my-parts-list.html'
     response.headers['Content-Type'] = 'text/html'
-    return response
+    return _maybe_gzip(response)
 
 @app.route('/export_html')
 def export_html():
     """Export saved parts to mobile-friendly HTML"""
-    from flask import make_response
-
     # Get the HTML content
     html_content = generate_parts_html()
 
     response = make_response(html_content)
     response.headers['Content-Type'] = 'text/html'
-    return response
+    return _maybe_gzip(response)
 
 def generate_parts_html():
     """Generate mobile-friendly HTML for parts list"""
-    from datetime import datetime
-
-    # Separate cars and trucks
-    cars = [p for p in saved_list.parts if p.get('vehicle_type') == 'car']
-    trucks = [p for p in saved_list.parts if p.get('vehicle_type') != 'car']
-
-    def create_parts_html(parts, title):
-        if not parts:
-            return ''
-
-        html = f'<h2 style="color: #667eea; margin-top: 30px; border-bottom: 2px solid #667eea; padding-bottom: 10px;">{title}</h2>'
-
-        for part in parts:
-            ebay_price = part.get('ebay_price', part.get('ebay_sold_price', part.get('median_sold_price', 0)))
-            junkyard_price = part.get('junkyard_price', 0)
-            roi = part.get('roi', 0)
-            roi_rating = part.get('roi_rating', 'N/A')
-
-            # ROI badge color
-            roi_color = '#28a745' if roi_rating == 'High' else ('#ffc107' if roi_rating == 'Medium' else '#dc3545')
-
-            # Vehicle info
-            vehicle_info = f"{part.get('year', '')} {part.get('make', '')} {part.get('model', '')}".strip()
-
-            html += f'''
-            <div style="background: white; padding: 20px; margin: 15px 0; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                <h3 style="margin: 0 0 15px 0; color: #333; font-size: 1.3em;">{part.get('part_name', 'N/A')}</h3>
-
-                {f'<p style="margin: 5px 0; color: #666; font-size: 0.95em;"><strong>Vehicle:</strong> {vehicle_info}</p>' if vehicle_info else ''}
-
-                <div style="margin: 15px 0; padding: 12px; background: #f0f9ff; border-left: 4px solid #667eea; border-radius: 4px;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                        <p style="margin: 0; font-weight: bold; color: #667eea; font-size: 0.9em;">📋 EBAY TITLE:</p>
-                        <button onclick="copyToClipboard('{part.get('ebay_title', 'N/A').replace("'", "\\'")}', this)" style="background: #667eea; color: white; border: none; padding: 6px 12px; border-radius: 6px; font-size: 0.85em; font-weight: bold; cursor: pointer;">📋 Copy</button>
-                    </div>
-                    <p style="margin: 0; padding: 8px; background: white; border-radius: 4px; font-family: monospace; font-size: 0.9em; color: #333; word-break: break-word;">
-                        {part.get('ebay_title', 'N/A')}
-                    </p>
-                </div>
-
-                <p style="margin: 10px 0;">
-                    <a href="{part.get('ebay_url', '#')}" target="_blank" style="display: inline-block; background: #667eea; color: white; padding: 10px 20px; border-radius: 8px; text-decoration: none; font-weight: bold;">🔗 Open eBay Listing</a>
-                </p>
-
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin: 15px 0;">
-                    <div style="background: #f8f9fa; padding: 12px; border-radius: 8px; text-align: center;">
-                        <div style="font-size: 0.85em; color: #666;">Junkyard</div>
-                        <div style="font-size: 1.4em; font-weight: bold; color: #28a745;">${junkyard_price:.2f}</div>
-                    </div>
-                    <div style="background: #f8f9fa; padding: 12px; border-radius: 8px; text-align: center;">
-                        <div style="font-size: 0.85em; color: #666;">eBay Sold</div>
-                        <div style="font-size: 1.4em; font-weight: bold; color: #667eea;">${ebay_price:.2f}</div>
-                    </div>
-                </div>
-
-                <div style="text-align: center; margin: 15px 0;">
-                    <div style="font-size: 0.85em; color: #666; margin-bottom: 5px;">ROI</div>
-                    <div style="display: inline-block; background: {roi_color}; color: white; padding: 8px 20px; border-radius: 20px; font-size: 1.2em; font-weight: bold;">
-                        {roi:.2f}x - {roi_rating}
-                    </div>
-                </div>
-
-                {f'<p style="margin: 10px 0;"><a href="{part.get("youtube_link", "")}" target="_blank" style="display: inline-block; background: #ff0000; color: white; padding: 10px 20px; border-radius: 8px; text-decoration: none; font-weight: bold;">🎥 Watch Tutorial</a></p>' if part.get('youtube_link', '').strip() else ''}
-
-                {f'<div style="background: #fff3cd; padding: 12px; border-radius: 8px; margin-top: 10px;"><strong style="color: #856404;">Notes:</strong><br><span style="color: #856404;">{part.get("notes", "")}</span></div>' if part.get('notes', '').strip() else ''}
-
-                <p style="margin: 10px 0 0 0; font-size: 0.8em; color: #999;">Added: {part.get('saved_at', 'N/A')}</p>
-            </div>
-            '''
-
-        return html
-
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-    <meta name="apple-mobile-web-app-capable" content="yes">
-    <title>Car Parts List - {datetime.now().strftime("%Y-%m-%d")}</title>
-    <style>
-        * {{
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 15px;
-            line-height: 1.6;
-        }}
-
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-        }}
-
-        h1 {{
-            color: white;
-            text-align: center;
-            margin: 20px 0;
-            font-size: 1.8em;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-        }}
-
-        .summary {{
-            background: white;
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-
-        .summary h3 {{
-            color: #667eea;
-            font-size: 1.5em;
-            margin-bottom: 10px;
-        }}
-
-        @media print {{
-            body {{
-                background: white;
-                padding: 0;
-            }}
-
-            .container {{
-                max-width: 100%;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚗 Car Parts List</h1>
-        <div class="summary">
-            <h3>Total Parts: {len(saved_list.parts)}</h3>
-            <p style="color: #666; margin-top: 5px;">Cars: {len(cars)} | Trucks/SUVs: {len(trucks)}</p>
-            <p style="color: #999; font-size: 0.9em; margin-top: 10px;">Exported: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}</p>
-        </div>
-
-        {create_parts_html(cars, '🚗 Cars')}
-        {create_parts_html(trucks, '🚙 Trucks / SUVs')}
-    </div>
-
-    <script>
-        function copyToClipboard(text, button) {{
-            // Copy text to clipboard
-            if (navigator.clipboard && navigator.clipboard.writeText) {{
-                navigator.clipboard.writeText(text).then(function() {{
-                    // Show success feedback
-                    const originalText = button.innerHTML;
-                    button.innerHTML = '✅ Copied!';
-                    button.style.background = '#28a745';
-
-                    // Reset button after 2 seconds
-                    setTimeout(function() {{
-                        button.innerHTML = originalText;
-                        button.style.background = '#667eea';
-                    }}, 2000);
-                }}).catch(function(err) {{
-                    alert('Failed to copy: ' + err);
-                }});
-            }} else {{
-                // Fallback for older browsers/devices
-                const textArea = document.createElement('textarea');
-                textArea.value = text;
-                textArea.style.position = 'fixed';
-                textArea.style.opacity = '0';
-                document.body.appendChild(textArea);
-                textArea.select();
-                try {{
-                    document.execCommand('copy');
-                    const originalText = button.innerHTML;
-                    button.innerHTML = '✅ Copied!';
-                    button.style.background = '#28a745';
-                    setTimeout(function() {{
-                        button.innerHTML = originalText;
-                        button.style.background = '#667eea';
-                    }}, 2000);
-                }} catch (err) {{
-                    alert('Failed to copy');
-                }}
-                document.body.removeChild(textArea);
-            }}
-        }}
-    </script>
-</body>
-</html>'''
-
-    return html_content
-
+    # Rendered through a compiled Jinja template instead of f-string
+    # concatenation, so part fields are HTML-escaped properly
+    return render_template('parts_export.html', cars=saved_list.cars,
+                           trucks=saved_list.trucks, now=datetime.now())
 @app.route('/filter', methods=['POST'])
 def filter_results():
     """Filter results by ROI or sort"""
@@ -19,6 +19,7 @@ class Config:
     # File Paths
     JUNKYARD_PRICES_CSV = 'Junkyard Pricing.csv'
     SAVED_PARTS_DB = 'saved_parts.json'
+    EBAY_CACHE_DIR = '.ebay_cache'
 
     @staticmethod
     def validate():
@@ -1,13 +1,65 @@
 from ebaysdk.finding import Connection as Finding
 from typing import List, Dict, Optional
-import statistics
+import hashlib
+import re
+import numpy as np
 from config import Config
+from ratelimit import TokenBucket
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+def _robust_stats(prices: np.ndarray) -> tuple:
+    """Median and mean after rejecting points beyond 3 scaled MADs
+
+    Small numeric kernel kept at module level and free of Python object
+    work so it stays on the NumPy fast path.
+
+    Returns (median, mean, kept_prices).
+    """
+    if prices.size > 3:
+        med = np.median(prices)
+        # One deviation buffer feeds both the MAD and the keep-mask, so
+        # the array is traversed once instead of twice
+        dev = np.abs(prices - med)
+        mad = 1.4826 * np.median(dev)
+        if mad > 0:
+            prices = prices[dev <= 3 * mad]
+
+    if not prices.size:
+        return 0.0, 0.0, prices
+
+    return float(np.median(prices)), float(prices.mean()), prices
 
 class EbayAPI:
     """Handles eBay API interactions"""
 
+    FINDING_ENDPOINTS = {
+        'production': 'https://svcs.ebay.com/services/search/FindingService/v1',
+        'sandbox': 'https://svcs.sandbox.ebay.com/services/search/FindingService/v1'
+    }
+
+    # How long cached eBay responses stay valid (prices move slowly)
+    CACHE_TTL = 24 * 60 * 60
+
     def __init__(self):
         self.api = None
+
+        # Disk-backed cache so repeat queries skip the network entirely
+        self.cache = None
+        if diskcache is not None:
+            try:
+                self.cache = diskcache.Cache(Config.EBAY_CACHE_DIR)
+            except Exception as e:
+                print(f"[WARNING] Could not open eBay cache: {e}")
+
         self.connect()
 
     def connect(self):
@@ -51,6 +103,11 @@ class EbayAPI:
         if not self.api:
             return self._demo_data(part_name)
 
+        cache_key = self._cache_key(year, make, model, part_name, days)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Build search query
             query = f"{year} {make} {model} {part_name} used"
@@ -73,74 +130,370 @@ class EbayAPI:
             })
 
             # Process sold items
-            sold_items = self._parse_sold_items(sold_response)
+            prices, best_listing = self._parse_sold_items(sold_response)
             active_count = self._count_active_items(active_response)
 
-            return self._calculate_metrics(sold_items, active_count)
+            metrics = self._calculate_metrics(prices, best_listing, active_count)
+            self._cache_set(cache_key, metrics)
+            return metrics
 
         except Exception as e:
             print(f"[ERROR] Error searching eBay: {e}")
             return self._demo_data(part_name)
 
-    def _parse_sold_items(self, response) -> List[Dict]:
-        """Parse eBay API response for sold items"""
-        items = []
+    @staticmethod
+    def _cache_key(year: str, make: str, model: str, part_name: str, days: int) -> str:
+        digest = hashlib.blake2b(f"{year}|{make}|{model}|{part_name}|{days}".encode()).hexdigest()
+        return f"search:{digest}"
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception:
+            return None
 
+    def _cache_set(self, key: str, value: Dict):
+        if self.cache is None:
+            return
         try:
-            search_result = response.dict()
-            if 'searchResult' in search_result:
-                item_list = search_result['searchResult'].get('item', [])
+            self.cache.set(key, value, expire=self.CACHE_TTL)
+        except Exception as e:
+            print(f"[WARNING] Could not cache eBay response: {e}")
+
+    # eBay caps Finding API keyword strings at 350 characters
+    MAX_KEYWORDS_LEN = 350
+
+    # Commas and parentheses are OR-group syntax to the Finding API, so
+    # part names must be cleaned before they can ride in a keyword group
+    _KEYWORD_QUALIFIER_RE = re.compile(r'\([^)]*\)')
+    _KEYWORD_PUNCT_RE = re.compile(r'[^A-Za-z0-9 ]+')
+
+    @classmethod
+    def _keyword_safe(cls, part_name: str) -> str:
+        """Part name with parenthesized qualifiers and punctuation removed"""
+        cleaned = cls._KEYWORD_QUALIFIER_RE.sub(' ', part_name)
+        cleaned = cls._KEYWORD_PUNCT_RE.sub(' ', cleaned)
+        return ' '.join(cleaned.split())
+
+    def search_sold_items_bulk(self, year: str, make: str, model: str,
+                               part_names: List[str], days: int = 30) -> Dict[str, Dict]:
+        """
+        Search sold listings for many parts with batched API calls
+
+        Groups up to ~10 parts per request using the Finding API's
+        (a,b,c) OR keyword syntax, then buckets the returned items back
+        to parts by matching title words against each part's cleaned
+        name. One call covers a whole group instead of two per part.
+
+        Returns a dict mapping each part name to the same metrics dict
+        that search_sold_items produces.
+        """
+        if not self.api:
+            return {part: self._demo_data(part) for part in part_names}
+
+        # Serve cached parts and only query the rest
+        results = {}
+        uncached = []
+        for part in part_names:
+            cached = self._cache_get(self._cache_key(year, make, model, part, days))
+            if cached is not None:
+                results[part] = cached
+            else:
+                uncached.append(part)
+
+        # Names like "BUMPER COVER, FRONT" would be split apart by the OR
+        # syntax, so each part is batched under its cleaned form; parts
+        # whose cleaned name is empty or collides with another go through
+        # the plain per-part search instead
+        pairs = []
+        seen_safe = set()
+        for part in uncached:
+            safe = self._keyword_safe(part)
+            if safe and safe.upper() not in seen_safe:
+                seen_safe.add(safe.upper())
+                pairs.append((part, safe))
+            else:
+                results[part] = self.search_sold_items(year, make, model, part, days)
+
+        prefix = f"({year} {make} {model}) "
+
+        # Build keyword groups under the 350-char limit, ~10 parts each
+        groups = []
+        group = []
+        for pair in pairs:
+            candidate = group + [pair]
+            keywords = prefix + "(" + ",".join(safe for _, safe in candidate) + ")"
+            if group and (len(candidate) > 10 or len(keywords) > self.MAX_KEYWORDS_LEN):
+                groups.append(group)
+                group = [pair]
+            else:
+                group = candidate
+        if group:
+            groups.append(group)
+
+        # Pace batched calls at 1/sec; no extra wait when the calls
+        # themselves already took that long
+        bucket = TokenBucket(rate_per_sec=1, burst=1)
+
+        for group in groups:
+            bucket.consume()
+
+            keywords = prefix + "(" + ",".join(safe for _, safe in group) + ")"
+            sold_idx_by_part = {part: [] for part, _ in group}
+            active_by_part = {part: 0 for part, _ in group}
+
+            # A title belongs to a part when it contains every word of the
+            # cleaned name, regardless of word order ("Front Bumper Cover"
+            # vs "BUMPER COVER, FRONT"); most specific part wins ties
+            part_tokens = [(part, set(safe.upper().split())) for part, safe in group]
+            part_tokens.sort(key=lambda entry: len(entry[1]), reverse=True)
+
+            def part_for_title(title):
+                title_tokens = set(self._KEYWORD_PUNCT_RE.sub(' ', title).upper().split())
+                for part, tokens in part_tokens:
+                    if tokens <= title_tokens:
+                        return part
+                return None
 
-                for item in item_list:
-                    price = float(item['sellingStatus']['currentPrice']['value'])
+            try:
+                sold_response = self.api.execute('findCompletedItems', {
+                    'keywords': keywords,
+                    'itemFilter': [{'name': 'SoldItemsOnly', 'value': True}],
+                    'sortOrder': 'PricePlusShippingLowest',
+                    'paginationInput': {'entriesPerPage': 100}
+                })
+                active_response = self.api.execute('findItemsAdvanced', {
+                    'keywords': keywords,
+                    'paginationInput': {'entriesPerPage': 100}
+                })
+            except Exception as e:
+                print(f"[ERROR] Error searching eBay: {e}")
+                for part, _ in group:
+                    results[part] = self._demo_data(part)
+                continue
+
+            # Bucket sold items back to parts by matching titles
+            prices, titles, urls, images = self._parse_sold_arrays(sold_response)
+            for idx, title in enumerate(titles):
+                part = part_for_title(title)
+                if part:
+                    sold_idx_by_part[part].append(idx)
+
+            # Bucket active listings the same way
+            try:
+                for item in self._reply_items(active_response):
+                    part = part_for_title(getattr(item, 'title', ''))
+                    if part:
+                        active_by_part[part] += 1
+            except Exception:
+                pass
+
+            for part, _ in group:
+                idxs = sold_idx_by_part[part]
+                best_listing = None
+                if idxs:
+                    first = idxs[0]
+                    best_listing = {
+                        'title': titles[first],
+                        'price': float(prices[first]),
+                        'url': urls[first],
+                        'image': images[first]
+                    }
+                metrics = self._calculate_metrics(prices[idxs], best_listing,
+                                                  active_by_part[part])
+                self._cache_set(self._cache_key(year, make, model, part, days), metrics)
+                results[part] = metrics
+
+        return results
+
+    async def search_sold_items_async(self, session, year: str, make: str, model: str,
+                                      part_name: str, days: int = 30) -> Dict:
+        """Async variant of search_sold_items
+
+        Talks to the Finding API directly over HTTP (the ebaysdk client is
+        blocking), so many part searches can be in flight on one session.
+        """
+        if not Config.EBAY_APP_ID:
+            return self._demo_data(part_name)
+
+        cache_key = self._cache_key(year, make, model, part_name, days)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        query = f"{year} {make} {model} {part_name} used"
+        base_params = {
+            'SECURITY-APPNAME': Config.EBAY_APP_ID,
+            'SERVICE-VERSION': '1.13.0',
+            'RESPONSE-DATA-FORMAT': 'JSON',
+            'keywords': query,
+            'paginationInput.entriesPerPage': '100'
+        }
+        sold_params = dict(base_params, **{
+            'OPERATION-NAME': 'findCompletedItems',
+            'itemFilter(0).name': 'SoldItemsOnly',
+            'itemFilter(0).value': 'true',
+            'sortOrder': 'PricePlusShippingLowest'
+        })
+        active_params = dict(base_params, **{
+            'OPERATION-NAME': 'findItemsAdvanced'
+        })
 
-                    items.append({
-                        'title': item.get('title', ''),
+        url = self.FINDING_ENDPOINTS.get(Config.EBAY_ENVIRONMENT,
+                                         self.FINDING_ENDPOINTS['production'])
+
+        try:
+            async with session.get(url, params=sold_params) as resp:
+                sold_payload = await resp.json(content_type=None)
+            async with session.get(url, params=active_params) as resp:
+                active_payload = await resp.json(content_type=None)
+        except Exception as e:
+            print(f"[ERROR] Error searching eBay: {e}")
+            return self._demo_data(part_name)
+
+        prices, best_listing = self._parse_sold_json(sold_payload)
+        active_count = self._count_active_json(active_payload)
+
+        metrics = self._calculate_metrics(prices, best_listing, active_count)
+        self._cache_set(cache_key, metrics)
+        return metrics
+
+    def _parse_sold_json(self, payload):
+        """Parse the Finding API JSON payload (every field is a 1-element list)
+
+        Returns (prices, best_listing) like _parse_sold_items.
+        """
+        prices = np.empty(100, dtype=np.float64)
+        count = 0
+        best_listing = None
+
+        try:
+            root = payload['findCompletedItemsResponse'][0]
+            item_list = root.get('searchResult', [{}])[0].get('item', [])
+
+            for item in item_list:
+                price = float(item['sellingStatus'][0]['currentPrice'][0]['__value__'])
+                if count == prices.size:
+                    prices = np.resize(prices, prices.size * 2)
+                prices[count] = price
+                count += 1
+
+                # Results arrive cheapest-first; only the winner is kept
+                if best_listing is None:
+                    best_listing = {
+                        'title': item.get('title', [''])[0],
                         'price': price,
-                        'url': item.get('viewItemURL', ''),
-                        'image': item.get('galleryURL', '')
-                    })
+                        'url': item.get('viewItemURL', [''])[0],
+                        'image': item.get('galleryURL', [''])[0]
+                    }
         except Exception as e:
             print(f"[ERROR] Error parsing sold items: {e}")
 
+        return prices[:count], best_listing
+
+    def _count_active_json(self, payload) -> int:
+        """Count active listings from the Finding API JSON payload"""
+        try:
+            root = payload['findItemsAdvancedResponse'][0]
+            return int(root['paginationOutput'][0]['totalEntries'][0])
+        except Exception:
+            return 0
+
+    def _parse_sold_items(self, response):
+        """Parse eBay API response for sold items
+
+        Prices go straight into a preallocated float64 buffer instead of a
+        dict per listing, and only the first (cheapest, per the request's
+        sort order) listing is materialized as the best-listing dict.
+
+        Returns (prices, best_listing).
+        """
+        prices = np.empty(100, dtype=np.float64)
+        count = 0
+        best_listing = None
+
+        try:
+            for item in self._reply_items(response):
+                price = float(item.sellingStatus.currentPrice.value)
+                if count == prices.size:
+                    prices = np.resize(prices, prices.size * 2)
+                prices[count] = price
+                count += 1
+
+                if best_listing is None:
+                    best_listing = {
+                        'title': getattr(item, 'title', ''),
+                        'price': price,
+                        'url': getattr(item, 'viewItemURL', ''),
+                        'image': getattr(item, 'galleryURL', '')
+                    }
+        except Exception as e:
+            print(f"[ERROR] Error parsing sold items: {e}")
+
+        return prices[:count], best_listing
+
+    @staticmethod
+    def _reply_items(response):
+        """Item list from the parsed reply, without materializing .dict()
+
+        ebaysdk exposes attribute access on the parsed response; a single
+        result comes back as a bare object rather than a one-element list.
+        """
+        search_result = getattr(response.reply, 'searchResult', None)
+        items = getattr(search_result, 'item', None) if search_result is not None else None
+        if items is None:
+            return []
+        if not isinstance(items, list):
+            items = [items]
         return items
 
+    def _parse_sold_arrays(self, response):
+        """Parse sold listings into parallel arrays for bulk bucketing
+
+        The bulk path needs every title to route items back to their part,
+        so it gets (prices, titles, urls, images) with shared indices.
+        """
+        prices = np.empty(100, dtype=np.float64)
+        count = 0
+        titles, urls, images = [], [], []
+
+        try:
+            for item in self._reply_items(response):
+                price = float(item.sellingStatus.currentPrice.value)
+                if count == prices.size:
+                    prices = np.resize(prices, prices.size * 2)
+                prices[count] = price
+                count += 1
+
+                titles.append(getattr(item, 'title', ''))
+                urls.append(getattr(item, 'viewItemURL', ''))
+                images.append(getattr(item, 'galleryURL', ''))
+        except Exception as e:
+            print(f"[ERROR] Error parsing sold items: {e}")
+
+        return prices[:count], titles, urls, images
+
     def _count_active_items(self, response) -> int:
         """Count active listings from response"""
         try:
-            search_result = response.dict()
-            return int(search_result.get('paginationOutput', {}).get('totalEntries', 0))
+            return int(response.reply.paginationOutput.totalEntries)
         except:
             return 0
 
-    def _calculate_metrics(self, sold_items: List[Dict], active_count: int) -> Dict:
-        """Calculate price metrics from sold items"""
-
-        if not sold_items:
-            return {
-                'median_price': 0,
-                'average_price': 0,
-                'sold_count': 0,
-                'active_listings': active_count,
-                'best_listing': None,
-                'all_prices': []
-            }
-
-        prices = [item['price'] for item in sold_items]
-
-        # Remove outliers (prices > 3 standard deviations from mean)
-        if len(prices) > 3:
-            mean = statistics.mean(prices)
-            stdev = statistics.stdev(prices)
-            prices = [p for p in prices if abs(p - mean) <= 3 * stdev]
+    def _calculate_metrics(self, prices: np.ndarray, best_listing: Optional[Dict],
+                           active_count: int) -> Dict:
+        """Calculate price metrics from a parsed price array"""
+        median_price, average_price, kept = _robust_stats(prices)
 
         return {
-            'median_price': statistics.median(prices) if prices else 0,
-            'average_price': statistics.mean(prices) if prices else 0,
-            'sold_count': len(sold_items),
+            'median_price': median_price,
+            'average_price': average_price,
+            'sold_count': int(prices.size),
             'active_listings': active_count,
-            'best_listing': sold_items[0] if sold_items else None,
-            'all_prices': prices
+            'best_listing': best_listing,
+            'all_prices': kept.tolist()
         }
 
     def _demo_data(self, part_name: str) -> Dict:
@@ -1,13 +1,70 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import hashlib
 import re
 from typing import Dict, Optional
+from config import Config
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Parsed listings are cached on disk so re-pasting a link skips the fetch
+if diskcache is not None:
+    try:
+        _link_cache = diskcache.Cache(Config.EBAY_CACHE_DIR)
+    except Exception:
+        _link_cache = None
+else:
+    _link_cache = None
+
+_LINK_CACHE_TTL = 24 * 60 * 60
+
+# Patterns compiled once at import - parse_link runs them on every call
+_MAKES = ['Honda', 'Toyota', 'Ford', 'Chevy', 'Chevrolet', 'Dodge',
+          'Nissan', 'BMW', 'Mercedes', 'Audi', 'Volkswagen', 'VW',
+          'Mazda', 'Subaru', 'Kia', 'Hyundai', 'Jeep', 'GMC', 'RAM']
+_MAKES_BY_UPPER = {make.upper(): make for make in _MAKES}
+_MAKE_RE = re.compile(r'\b(' + '|'.join(_MAKES) + r')\b', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(19\d{2}|20[0-2]\d)\b')
+_PRICE_RE = re.compile(r'\$?([\d,]+\.?\d*)')
+
+# Part keywords for extract_part_name, longest alternatives matched first
+_PART_KEYWORDS = [
+    'headlight', 'taillight', 'bumper', 'fender', 'hood', 'door',
+    'mirror', 'grille', 'radio', 'stereo', 'cluster', 'speedometer',
+    'wheel', 'rim', 'seat', 'console', 'dashboard', 'steering wheel',
+    'ECM', 'TCM', 'PCM', 'module', 'sensor', 'switch', 'airbag'
+]
+_PART_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_PART_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE
+)
 
 class EbayLinkParser:
     """Parse eBay listing links to extract part info and price"""
 
-    @staticmethod
-    def parse_link(ebay_url: str) -> Dict:
+    def __init__(self):
+        # Pooled session with keep-alive so parsing many links reuses one
+        # TCP+TLS connection instead of handshaking per URL
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def parse_link(self, ebay_url: str) -> Dict:
         """
         Parse an eBay listing URL to extract:
         - Item title
@@ -16,37 +73,26 @@ class EbayLinkParser:
 
         Returns dict with extracted info
         """
+        cache_key = f"link:{hashlib.blake2b(ebay_url.encode()).hexdigest()}"
+        if _link_cache is not None:
+            cached = _link_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Send request to eBay
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(ebay_url, headers=headers, timeout=10)
+            response = self.session.get(ebay_url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            title, price_text = EbayLinkParser._extract_fields(response.content)
 
-            # Extract title
-            title = None
-            title_elem = soup.find('h1', {'class': 'x-item-title__mainTitle'})
-            if not title_elem:
-                title_elem = soup.find('h1', {'id': 'itemTitle'})
-            if title_elem:
-                title = title_elem.get_text().strip()
-
-            # Extract price
+            # Extract numeric price
             price = None
-            # Try sold/completed listing price first
-            price_elem = soup.find('div', {'class': 'x-price-primary'})
-            if not price_elem:
-                price_elem = soup.find('span', {'id': 'prcIsum'})
-            if not price_elem:
-                price_elem = soup.find('span', {'class': 'notranslate'})
-
-            if price_elem:
-                price_text = price_elem.get_text().strip()
-                # Extract numeric price
-                price_match = re.search(r'\$?([\d,]+\.?\d*)', price_text)
+            if price_text:
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     price = float(price_match.group(1).replace(',', ''))
 
@@ -57,20 +103,16 @@ class EbayLinkParser:
 
             if title:
                 # Look for year (4 digits)
-                year_match = re.search(r'\b(19\d{2}|20[0-2]\d)\b', title)
+                year_match = _YEAR_RE.search(title)
                 if year_match:
                     year = year_match.group(1)
 
-                # Common makes
-                makes = ['Honda', 'Toyota', 'Ford', 'Chevy', 'Chevrolet', 'Dodge',
-                        'Nissan', 'BMW', 'Mercedes', 'Audi', 'Volkswagen', 'VW',
-                        'Mazda', 'Subaru', 'Kia', 'Hyundai', 'Jeep', 'GMC', 'RAM']
-                for make_name in makes:
-                    if re.search(rf'\b{make_name}\b', title, re.IGNORECASE):
-                        make = make_name
-                        break
+                # Common makes - one alternation scan instead of a pattern per make
+                make_match = _MAKE_RE.search(title)
+                if make_match:
+                    make = _MAKES_BY_UPPER[make_match.group(1).upper()]
 
-            return {
+            result = {
                 'success': True,
                 'title': title or 'Unknown',
                 'price': price or 0.0,
@@ -80,6 +122,15 @@ class EbayLinkParser:
                 'url': ebay_url
             }
 
+            # Only successful parses are cached; errors should retry
+            if _link_cache is not None:
+                try:
+                    _link_cache.set(cache_key, result, expire=_LINK_CACHE_TTL)
+                except Exception:
+                    pass
+
+            return result
+
         except Exception as e:
             return {
                 'success': False,
@@ -92,24 +143,54 @@ class EbayLinkParser:
                 'url': ebay_url
             }
 
+    @staticmethod
+    def _extract_fields(content: bytes):
+        """Pull the title and raw price text out of listing HTML
+
+        Uses selectolax (C parser, one CSS query per field) when available
+        and falls back to BeautifulSoup with html.parser.
+        """
+        if HTMLParser is not None:
+            tree = HTMLParser(content)
+
+            title_node = tree.css_first('h1.x-item-title__mainTitle, h1#itemTitle')
+            title = title_node.text(strip=True) if title_node else None
+
+            # Sold/completed listing price selectors first
+            price_node = tree.css_first('div.x-price-primary, span#prcIsum, span.notranslate')
+            price_text = price_node.text(strip=True) if price_node else None
+
+            return title, price_text
+
+        soup = BeautifulSoup(content, 'html.parser')
+
+        title = None
+        title_elem = soup.find('h1', {'class': 'x-item-title__mainTitle'})
+        if not title_elem:
+            title_elem = soup.find('h1', {'id': 'itemTitle'})
+        if title_elem:
+            title = title_elem.get_text().strip()
+
+        price_text = None
+        price_elem = soup.find('div', {'class': 'x-price-primary'})
+        if not price_elem:
+            price_elem = soup.find('span', {'id': 'prcIsum'})
+        if not price_elem:
+            price_elem = soup.find('span', {'class': 'notranslate'})
+        if price_elem:
+            price_text = price_elem.get_text().strip()
+
+        return title, price_text
+
     @staticmethod
     def extract_part_name(title: str) -> str:
         """
         Try to extract the part name from the title
         e.g., "2013 Honda Accord Headlight Left" -> "Headlight"
         """
-        # Common part keywords
-        parts = [
-            'headlight', 'taillight', 'bumper', 'fender', 'hood', 'door',
-            'mirror', 'grille', 'radio', 'stereo', 'cluster', 'speedometer',
-            'wheel', 'rim', 'seat', 'console', 'dashboard', 'steering wheel',
-            'ECM', 'TCM', 'PCM', 'module', 'sensor', 'switch', 'airbag'
-        ]
-
-        title_lower = title.lower()
-        for part in parts:
-            if part in title_lower:
-                return part.title()
+        match = _PART_RE.search(title)
+        if match:
+            return match.group(0).title()
 
         # If no match, return first 3 words
         words = title.split()[:3]
@@ -1,12 +1,26 @@
+import bisect
 import pandas as pd
 from typing import Optional
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+except ImportError:
+    rf_process = None
+
 class JunkyardPrices:
     """Manages junkyard pricing data"""
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
         self.prices = {}
+        self.upper_names = []
+        self._sorted_upper = []
+        self._automaton = None
         self.load_prices()
 
     def load_prices(self):
@@ -18,35 +32,101 @@ class JunkyardPrices:
             # Clean up the data
             df = df[['Part', 'Price']].dropna()
 
-            # Remove dollar signs and convert to float
-            df['Price'] = df['Price'].str.replace('$', '').str.replace(',', '').astype(float)
+            # Vectorized cleanup - iterrows() builds a Series per row, which
+            # is the slowest way to walk a frame
+            parts = df['Part'].str.strip().str.upper().to_numpy()
+            prices = df['Price'].str.replace(r'[\$,]', '', regex=True).astype(float).to_numpy()
 
             # Create dictionary with uppercase keys for case-insensitive matching
-            self.prices = {
-                row['Part'].strip().upper(): row['Price']
-                for _, row in df.iterrows()
-            }
+            self.prices = dict(zip(parts.tolist(), prices.tolist()))
+
+            # Keys are already uppercased - cache the list once so keyword
+            # matching doesn't re-uppercase every part on every request
+            self.upper_names = list(self.prices)
+            self._sorted_upper = sorted(self.upper_names)
+
+            # Build an Aho-Corasick automaton so keyword matching is a single
+            # linear scan instead of a substring check per junkyard name
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for name in self.prices:
+                    automaton.add_word(name, name)
+                automaton.make_automaton()
+                self._automaton = automaton
 
             print(f"[OK] Loaded {len(self.prices)} parts from junkyard price list")
 
         except Exception as e:
             print(f"[ERROR] Error loading junkyard prices: {e}")
             self.prices = {}
+            self.upper_names = []
+            self._sorted_upper = []
+            self._automaton = None
 
     def get_price(self, part_name: str) -> Optional[float]:
         """Get price for a specific part (case-insensitive)"""
         return self.prices.get(part_name.strip().upper())
 
+    def get_price_upper(self, upper_key: str) -> Optional[float]:
+        """Get price for an already-normalized (uppercase) key"""
+        return self.prices.get(upper_key)
+
+    def match_part(self, part_name: str) -> Optional[str]:
+        """Find a junkyard part whose name contains (or is contained in) part_name"""
+        part_name_upper = part_name.strip().upper()
+        if part_name_upper in self.prices:
+            return part_name_upper
+
+        if self._automaton is not None:
+            # One pass over part_name finds every junkyard name it contains;
+            # only the reverse direction still needs the list scan
+            hit = next((name for _, name in self._automaton.iter(part_name_upper)), None)
+            if hit:
+                return hit
+            return next((name for name in self.upper_names if part_name_upper in name), None)
+
+        # Containment can only run shorter-into-longer, so test one direction
+        # per pair - CPython's substring search cost scales with the needle
+        return next(
+            (name for name in self.upper_names
+             if (part_name_upper in name if len(part_name_upper) <= len(name)
+                 else name in part_name_upper)),
+            None
+        )
+
     def search_part(self, search_term: str) -> dict:
         """Search for parts matching a term"""
-        search_term = search_term.upper()
-        matches = {
-            name: price
-            for name, price in self.prices.items()
-            if search_term in name
-        }
+        search_term = search_term.strip().upper()
+        if not search_term:
+            return {}
+
+        # Prefix hits come from a bisect over the sorted key list; the
+        # substring scan then only covers the names outside that range,
+        # where a match can only be mid-string
+        lo = bisect.bisect_left(self._sorted_upper, search_term)
+        hi = bisect.bisect_right(self._sorted_upper, search_term + '\uffff')
+        matches = {name: self.prices[name] for name in self._sorted_upper[lo:hi]}
+
+        for name in self._sorted_upper[:lo]:
+            if search_term in name:
+                matches[name] = self.prices[name]
+        for name in self._sorted_upper[hi:]:
+            if search_term in name:
+                matches[name] = self.prices[name]
+
+        # Fuzzy fallback catches near-misses exact search can't, like
+        # HEADLAMP -> HEADLIGHT or "BUMPER FR" -> "BUMPER COVER, FRONT"
+        if rf_process is not None:
+            fuzzy = rf_process.extract(
+                search_term, self.upper_names,
+                scorer=rf_fuzz.partial_ratio, score_cutoff=70, limit=20
+            )
+            for name, _score, _idx in fuzzy:
+                if name not in matches:
+                    matches[name] = self.prices[name]
+
         return matches
 
     def get_all_parts(self) -> list:
         """Get list of all available parts"""
-        return sorted(list(self.prices.keys()))
+        return list(self._sorted_upper)
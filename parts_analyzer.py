@@ -1,7 +1,22 @@
 from typing import List, Dict
-import time
+import asyncio
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from ebay_api import EbayAPI
 from junkyard_prices import JunkyardPrices
+from ratelimit import TokenBucket
+from roi import rate_roi
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 class PartsAnalyzer:
     """Analyzes car parts for ROI potential"""
@@ -63,10 +78,48 @@ class PartsAnalyzer:
         "DOOR", "HOOD", "WHEEL", "HUBCAP", "BADGE"
     ]
 
+    _TOKEN_RE = re.compile(r'[A-Z0-9]+')
+
     def __init__(self, ebay_api: EbayAPI, junkyard_prices: JunkyardPrices):
         self.ebay = ebay_api
         self.junkyard = junkyard_prices
 
+        # Compile the keyword lists into Aho-Corasick automatons so each
+        # part name is filtered in one scan instead of a probe per keyword
+        self._interior_automaton = self._build_automaton(self.INTERIOR_KEYWORDS)
+        self._light_automaton = self._build_automaton(
+            self.INTERIOR_KEYWORDS + self.LIGHT_EXTERIOR_KEYWORDS
+        )
+
+        # Token -> junkyard parts index so high_priority matching only has
+        # to verify candidates that share a word, not every (pair) combination
+        self._token_index = defaultdict(set)
+        for part in self.junkyard.get_all_parts():
+            for token in self._TOKEN_RE.findall(part.upper()):
+                self._token_index[token].add(part)
+
+        # high_priority matches are stable after load - computed once on
+        # first use and keyed on the prices dict so a reload invalidates
+        self._high_priority_cache = None
+
+    @staticmethod
+    def _build_automaton(keywords: List[str]):
+        """Build a keyword automaton, or None when pyahocorasick is missing"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _matches(automaton, keywords: List[str], part_upper: str) -> bool:
+        """Check a part name against a keyword list via automaton or fallback scan"""
+        if automaton is not None:
+            return next(automaton.iter(part_upper), None) is not None
+        return any(keyword in part_upper for keyword in keywords)
+
     def get_parts_list(self, vehicle_type: str = "car", filter_type: str = "all") -> List[str]:
         """
         Get parts from junkyard database with optional filtering
@@ -80,15 +133,31 @@ class PartsAnalyzer:
         all_parts = self.junkyard.get_all_parts()
 
         if filter_type == "high_priority":
+            cached = self._high_priority_cache
+            if cached is not None and cached[0] == id(self.junkyard.prices):
+                return list(cached[1])
+
             # Return only high-priority parts that exist in junkyard database
             filtered = []
+            seen = set()
             for priority_part in self.HIGH_PRIORITY_PARTS:
-                # Find matching parts in junkyard list (case-insensitive)
-                for junkyard_part in all_parts:
-                    if priority_part.upper() in junkyard_part.upper() or junkyard_part.upper() in priority_part.upper():
-                        if junkyard_part not in filtered:
+                priority_upper = priority_part.upper()
+
+                # Candidates share at least one word with the priority part;
+                # only those need the substring check
+                candidates = set()
+                for token in self._TOKEN_RE.findall(priority_upper):
+                    candidates |= self._token_index.get(token, set())
+
+                for junkyard_part in sorted(candidates):
+                    if priority_upper in junkyard_part.upper() or junkyard_part.upper() in priority_upper:
+                        if junkyard_part not in seen:
+                            seen.add(junkyard_part)
                             filtered.append(junkyard_part)
-            return filtered[:30]  # Limit to 30 parts max
+
+            filtered = filtered[:30]  # Limit to 30 parts max
+            self._high_priority_cache = (id(self.junkyard.prices), filtered)
+            return list(filtered)
 
         if filter_type == "all":
             return all_parts
@@ -100,12 +169,14 @@ class PartsAnalyzer:
 
             if filter_type == "interior":
                 # Only interior parts
-                if any(keyword in part_upper for keyword in self.INTERIOR_KEYWORDS):
+                if self._matches(self._interior_automaton, self.INTERIOR_KEYWORDS, part_upper):
                     filtered.append(part)
 
             elif filter_type == "light":
                 # Interior + light exterior
-                if any(keyword in part_upper for keyword in self.INTERIOR_KEYWORDS + self.LIGHT_EXTERIOR_KEYWORDS):
+                if self._matches(self._light_automaton,
+                                 self.INTERIOR_KEYWORDS + self.LIGHT_EXTERIOR_KEYWORDS,
+                                 part_upper):
                     filtered.append(part)
 
         return filtered if filtered else all_parts
@@ -142,21 +213,20 @@ class PartsAnalyzer:
         # Get eBay market data
         ebay_data = self.ebay.search_sold_items(year, make, model, part_name)
 
+        return self._build_result(part_name, junkyard_price, ebay_data)
+
+    def _build_result(self, part_name: str, junkyard_price: float, ebay_data: Dict) -> Dict:
+        """Combine junkyard price and eBay market data into one result row"""
+
         # Calculate ROI
         roi = 0
         if junkyard_price > 0 and ebay_data['median_price'] > 0:
             roi = ebay_data['median_price'] / junkyard_price
 
         # Determine ROI rating
-        if roi < 2:
-            roi_rating = "Low"
-        elif roi < 5:
-            roi_rating = "Medium"
-        else:
-            roi_rating = "High"
-
-        # Build result
-        result = {
+        roi_rating = rate_roi(roi)
+
+        return {
             'part_name': part_name,
             'junkyard_price': junkyard_price,
             'median_sold_price': ebay_data['median_price'],
@@ -170,8 +240,6 @@ class PartsAnalyzer:
             'best_listing_image': ebay_data['best_listing']['image'] if ebay_data['best_listing'] else ''
         }
 
-        return result
-
     def analyze_vehicle(self, year: str, make: str, model: str, vehicle_type: str = "car", filter_type: str = "high_priority") -> List[Dict]:
         """
         Analyze all relevant parts for a vehicle
@@ -184,25 +252,123 @@ class PartsAnalyzer:
         Returns list of part analysis results
         """
         parts_list = self.get_parts_list(vehicle_type, filter_type)
-        results = []
+
+        if aiohttp is not None:
+            return asyncio.run(self.analyze_vehicle_async(year, make, model, parts_list))
+
+        return self._analyze_vehicle_serial(year, make, model, parts_list, filter_type)
+
+    async def analyze_vehicle_async(self, year: str, make: str, model: str,
+                                    parts_list: List[str], concurrency: int = 8) -> List[Dict]:
+        """Analyze parts concurrently over one aiohttp session
+
+        A semaphore caps in-flight searches and a token bucket admits
+        `concurrency` part-searches per second. Each part search costs two
+        HTTP calls (sold + active), so at the default concurrency of 8 that
+        is ~16 requests/sec against eBay - far above the old serial
+        1 part/sec pacing. Lower `concurrency` to shrink the rate budget.
+        """
+        total = len(parts_list)
+        print(f"\n{'='*60}")
+        print(f"Analyzing {total} parts for {year} {make} {model}")
+        print(f"Running up to {concurrency} eBay searches concurrently")
+        print(f"{'='*60}\n")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        bucket = TokenBucket(rate_per_sec=concurrency, burst=concurrency)
+
+        async def analyze_one(part: str) -> Dict:
+            junkyard_price = self.junkyard.get_price(part)
+            if junkyard_price is None:
+                return {'part_name': part, 'error': 'Part not found in junkyard price list'}
+
+            async with semaphore:
+                # Only waits when actually ahead of the eBay rate budget
+                wait = bucket.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                ebay_data = await self.ebay.search_sold_items_async(
+                    session, year, make, model, part
+                )
+
+            return self._build_result(part, junkyard_price, ebay_data)
+
+        connector = aiohttp.TCPConnector(limit=10)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            all_results = await asyncio.gather(*(analyze_one(part) for part in parts_list))
+
+        results = [r for r in all_results if 'error' not in r]
+
+        print(f"\n{'='*60}")
+        print(f"Analysis complete! Found {len(results)} parts with data")
+        print(f"{'='*60}\n")
+
+        # Sort by ROI (highest first)
+        results.sort(key=lambda x: x['roi'], reverse=True)
+
+        return results
+
+    def _analyze_vehicle_serial(self, year: str, make: str, model: str,
+                                parts_list: List[str], filter_type: str) -> List[Dict]:
+        """Fallback analysis used when aiohttp is not installed
+
+        Batches eBay calls when the API is connected; otherwise runs the
+        sync analyze_part calls in a thread pool - the work is I/O-bound,
+        so the GIL is released on network waits.
+        """
+        if self.ebay.api:
+            return self._analyze_vehicle_bulk(year, make, model, parts_list, filter_type)
 
         total = len(parts_list)
         print(f"\n{'='*60}")
         print(f"Analyzing {total} parts for {year} {make} {model}")
         print(f"Filter: {filter_type.upper()}")
-        print(f"Adding 1-second delay between searches to avoid rate limits")
+        print(f"Running up to 8 searches in threads, paced at ~8/sec")
         print(f"{'='*60}\n")
 
-        for i, part in enumerate(parts_list, 1):
-            print(f"[{i}/{total}] Analyzing: {part}...")
-            result = self.analyze_part(year, make, model, part)
+        # Pace request starts so the aggregate rate stays near the old
+        # 1 req/sec-per-worker budget across 8 workers
+        bucket = TokenBucket(rate_per_sec=8, burst=8)
+
+        def throttled_analyze(part: str) -> Dict:
+            bucket.consume()
+            return self.analyze_part(year, make, model, part)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_results = list(executor.map(throttled_analyze, parts_list))
+
+        results = [r for r in all_results if 'error' not in r]
+
+        print(f"\n{'='*60}")
+        print(f"Analysis complete! Found {len(results)} parts with data")
+        print(f"{'='*60}\n")
+
+        # Sort by ROI (highest first)
+        results.sort(key=lambda x: x['roi'], reverse=True)
+
+        return results
+
+    def _analyze_vehicle_bulk(self, year: str, make: str, model: str,
+                              parts_list: List[str], filter_type: str) -> List[Dict]:
+        """Serial analysis with ~10 parts batched into each eBay call"""
+        priced = [(part, self.junkyard.get_price(part)) for part in parts_list]
+        priced = [(part, price) for part, price in priced if price is not None]
+
+        total = len(priced)
+        print(f"\n{'='*60}")
+        print(f"Analyzing {total} parts for {year} {make} {model}")
+        print(f"Filter: {filter_type.upper()}")
+        print(f"Batching ~10 parts per eBay call")
+        print(f"{'='*60}\n")
 
-            if 'error' not in result:
-                results.append(result)
+        ebay_by_part = self.ebay.search_sold_items_bulk(
+            year, make, model, [part for part, _ in priced]
+        )
 
-            # Add delay to avoid eBay rate limiting (except on last item)
-            if i < total:
-                time.sleep(1)  # 1 second delay between searches
+        results = [
+            self._build_result(part, price, ebay_by_part[part])
+            for part, price in priced
+        ]
 
         print(f"\n{'='*60}")
         print(f"Analysis complete! Found {len(results)} parts with data")
@@ -0,0 +1,39 @@
+import threading
+import time
+
+class TokenBucket:
+    """Token-bucket rate limiter for pacing outbound API calls
+
+    Tokens refill continuously against the monotonic clock, so callers
+    only wait when they are actually ahead of the budget - time spent in
+    the request itself counts toward the refill, unlike a fixed sleep.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: float = 1.0):
+        self.rate = float(rate_per_sec)
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens now and return how long the caller should wait
+
+        Useful from async code, where the caller sleeps on the event loop
+        instead of blocking the thread.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def consume(self, tokens: float = 1.0):
+        """Block until the requested tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,13 @@
+"""Shared ROI classification
+
+The same thresholds drive the analyzer, the link importer, and manual entry:
+under 2x is Low, 2x-4.9x is Medium, 5x+ is High.
+"""
+
+def rate_roi(roi: float) -> str:
+    """Classify an ROI multiple into its Low/Medium/High rating"""
+    if roi < 2:
+        return "Low"
+    elif roi < 5:
+        return "Medium"
+    return "High"
@@ -1,7 +1,17 @@
+import atexit
 import json
 import os
-from typing import List, Dict
+import queue
+import threading
+import uuid
+from typing import List, Dict, Optional
 from datetime import datetime
+from roi import rate_roi
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class SavedPartsList:
     """Manages saved parts list"""
@@ -9,14 +19,26 @@ class SavedPartsList:
     def __init__(self, db_file: str):
         self.db_file = db_file
         self.parts = []
+        self.parts_by_id = {}
+        self._cars = []
+        self._trucks = []
+
+        # Saves are serialized on the caller thread but written to disk by a
+        # background thread so requests don't block on file I/O
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
         self.load()
 
     def load(self):
         """Load saved parts from JSON file"""
         if os.path.exists(self.db_file):
             try:
-                with open(self.db_file, 'r') as f:
-                    self.parts = json.load(f)
+                with open(self.db_file, 'rb') as f:
+                    raw = f.read()
+                self.parts = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 print(f"[OK] Loaded {len(self.parts)} saved parts")
             except Exception as e:
                 print(f"[ERROR] Error loading saved parts: {e}")
@@ -24,18 +46,107 @@ class SavedPartsList:
         else:
             self.parts = []
 
+        # Assign ids to entries saved before parts were id-keyed
+        migrated = False
+        for part in self.parts:
+            if 'id' not in part:
+                part['id'] = uuid.uuid4().hex
+                migrated = True
+
+        self.parts_by_id = {part['id']: part for part in self.parts}
+
+        # Dedup index so find_part is a dict lookup, not a list scan
+        self._find_index = {}
+        for part in self.parts:
+            self._find_index.setdefault(self._find_key(part), part)
+
+        if migrated:
+            self.save()
+
+        self._rebuild_split()
+
+    @staticmethod
+    def _find_key(part_data: Dict) -> tuple:
+        """Dedup key for a part: (year, make, model, part_name)"""
+        return (
+            part_data.get('year'),
+            part_data.get('make'),
+            part_data.get('model'),
+            part_data['part_name']
+        )
+
+    def _rebuild_split(self):
+        """Rebuild the car/truck partitions from the full parts list"""
+        self._cars = [p for p in self.parts if p.get('vehicle_type') == 'car']
+        self._trucks = [p for p in self.parts if p.get('vehicle_type') != 'car']
+
+    def _bucket_for(self, part_data: Dict) -> List[Dict]:
+        """Pick the partition a part belongs to"""
+        return self._cars if part_data.get('vehicle_type') == 'car' else self._trucks
+
+    @property
+    def cars(self) -> List[Dict]:
+        """Saved parts marked as cars"""
+        return self._cars
+
+    @property
+    def trucks(self) -> List[Dict]:
+        """Saved parts that are trucks/SUVs (anything not marked 'car')"""
+        return self._trucks
+
     def save(self):
-        """Save parts to JSON file"""
+        """Queue a save; the disk write happens on the background writer thread"""
         try:
-            with open(self.db_file, 'w') as f:
-                json.dump(self.parts, f, indent=2)
-            print(f"[OK] Saved {len(self.parts)} parts")
+            if orjson is not None:
+                snapshot = orjson.dumps(self.parts, option=orjson.OPT_INDENT_2)
+            else:
+                snapshot = json.dumps(self.parts, indent=2).encode()
         except Exception as e:
-            print(f"[ERROR] Error saving parts: {e}")
+            print(f"[ERROR] Error serializing parts: {e}")
+            return
+
+        self._write_queue.put((snapshot, len(self.parts)))
+
+    def flush(self):
+        """Block until all queued saves have reached disk"""
+        self._write_queue.join()
+
+    def _write_loop(self):
+        """Writer thread: coalesce queued snapshots and write the newest"""
+        while True:
+            snapshot, count = self._write_queue.get()
+            pending = 1
+
+            # Only the newest queued snapshot needs to hit disk
+            try:
+                while True:
+                    snapshot, count = self._write_queue.get_nowait()
+                    pending += 1
+            except queue.Empty:
+                pass
+
+            # Write to a temp file and rename so a crash mid-write can never
+            # leave a truncated saved_parts.json behind
+            try:
+                tmp_file = self.db_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(snapshot)
+                os.replace(tmp_file, self.db_file)
+                print(f"[OK] Saved {count} parts")
+            except Exception as e:
+                print(f"[ERROR] Error saving parts: {e}")
+
+            for _ in range(pending):
+                self._write_queue.task_done()
+
+    def get(self, part_id: str) -> Optional[Dict]:
+        """Look up a saved part by its id"""
+        return self.parts_by_id.get(part_id)
 
     def add_part(self, part_data: Dict):
         """Add a part to the saved list"""
-        # Add timestamp
+        # Add id and timestamp
+        part_data['id'] = uuid.uuid4().hex
         part_data['saved_at'] = datetime.now().isoformat()
 
         # Check if part already exists
@@ -51,6 +162,9 @@ class SavedPartsList:
             return False
 
         self.parts.append(part_data)
+        self.parts_by_id[part_data['id']] = part_data
+        self._find_index.setdefault(self._find_key(part_data), part_data)
+        self._bucket_for(part_data).append(part_data)
         self.save()
         print(f"[OK] Saved: {part_data['part_name']}")
         return True
@@ -58,15 +172,10 @@ class SavedPartsList:
     def add_manual(self, part_name: str, junkyard_price: float, ebay_sold_price: float):
         """Add a part manually with custom prices"""
         roi = ebay_sold_price / junkyard_price if junkyard_price > 0 else 0
-
-        if roi < 2:
-            roi_rating = "Low"
-        elif roi < 5:
-            roi_rating = "Medium"
-        else:
-            roi_rating = "High"
+        roi_rating = rate_roi(roi)
 
         part_data = {
+            'id': uuid.uuid4().hex,
             'part_name': part_name,
             'junkyard_price': junkyard_price,
             'ebay_sold_price': ebay_sold_price,
@@ -77,35 +186,44 @@ class SavedPartsList:
         }
 
         self.parts.append(part_data)
+        self.parts_by_id[part_data['id']] = part_data
+        self._find_index.setdefault(self._find_key(part_data), part_data)
+        self._bucket_for(part_data).append(part_data)
         self.save()
 
         return part_data
 
     def find_part(self, year: str, make: str, model: str, part_name: str) -> Dict:
         """Find a specific part in saved list"""
-        for part in self.parts:
-            if (part.get('year') == year and
-                part.get('make') == make and
-                part.get('model') == model and
-                part['part_name'] == part_name):
-                return part
-        return None
+        return self._find_index.get((year, make, model, part_name))
 
     def get_all(self) -> List[Dict]:
         """Get all saved parts"""
         return self.parts
 
-    def remove_part(self, index: int):
-        """Remove a part by index"""
-        if 0 <= index < len(self.parts):
-            removed = self.parts.pop(index)
-            self.save()
-            print(f"[OK] Removed: {removed['part_name']}")
-            return True
-        return False
+    def remove_part(self, part_id: str):
+        """Remove a part by id"""
+        removed = self.parts_by_id.pop(part_id, None)
+        if removed is None:
+            return False
+
+        self.parts.remove(removed)
+        key = self._find_key(removed)
+        if self._find_index.get(key) is removed:
+            del self._find_index[key]
+        bucket = self._bucket_for(removed)
+        if removed in bucket:
+            bucket.remove(removed)
+        self.save()
+        print(f"[OK] Removed: {removed['part_name']}")
+        return True
 
     def clear_all(self):
         """Clear all saved parts"""
         self.parts = []
+        self.parts_by_id = {}
+        self._find_index = {}
+        self._cars = []
+        self._trucks = []
         self.save()
         print("[OK] Cleared all saved parts")
@@ -1,7 +1,11 @@
-"""Generate app icons for PWA"""
+"""Generate app icons for PWA
+
+Build-time only - the PNGs are committed under static/ and nothing renders
+them at runtime. Run with: python -m scripts.create_icons
+"""
 from PIL import Image, ImageDraw, ImageFont
 
-def create_icon(size, filename):
+def create_icon(size):
     # Create a gradient background
     img = Image.new('RGB', (size, size), color='#667eea')
     draw = ImageDraw.Draw(img)
@@ -42,11 +46,16 @@ def create_icon(size, filename):
 
     draw.text((dollar_x, dollar_y), "$", fill='white', font=font, anchor='mm')
 
-    # Save
-    img.save(filename, 'PNG')
-    print(f"Created {filename}")
+    return img
 
 if __name__ == '__main__':
-    create_icon(192, 'static/icon-192.png')
-    create_icon(512, 'static/icon-512.png')
+    # Render the geometry once at 512px, downscale for the small variant
+    img512 = create_icon(512)
+    img512.save('static/icon-512.png', 'PNG')
+    print("Created static/icon-512.png")
+
+    img192 = img512.resize((192, 192), Image.LANCZOS)
+    img192.save('static/icon-192.png', 'PNG')
+    print("Created static/icon-192.png")
+
     print("Icons created successfully!")
@@ -0,0 +1,13 @@
+"""WSGI entry point for production servers
+
+Run with a threaded server so requests that block on eBay I/O can overlap:
+
+    gunicorn -k gthread -w 1 --threads 16 wsgi:app
+
+Keep it at one worker: saved parts and add-from-link jobs live in process
+memory, so multiple workers would not see each other's state.
+"""
+from app import app
+
+if __name__ == '__main__':
+    app.run()